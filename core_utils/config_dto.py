@@ -29,6 +29,9 @@ class ConfigDTO:
     #: Require headless mode or not
     headless_mode: bool
 
+    #: Minimal number of seconds between requests to one host
+    request_delay: float
+
     def __init__(self,
                  seed_urls: list[str],
                  total_articles_to_find_and_parse: int,
@@ -36,7 +39,8 @@ class ConfigDTO:
                  encoding: str,
                  timeout: int,
                  should_verify_certificate: bool,
-                 headless_mode: bool
+                 headless_mode: bool,
+                 request_delay: float = 1.0
                  ) -> None:
         """
         Initializes an instance of the ConfigDTO class.
@@ -49,6 +53,7 @@ class ConfigDTO:
             timeout (int): Number of seconds to wait for response
             should_verify_certificate (bool): Should verify certificate or not
             headless_mode (bool): Require headless mode or not
+            request_delay (float): Minimal number of seconds between requests to one host
         """
         self.seed_urls = seed_urls
         self.total_articles = total_articles_to_find_and_parse
@@ -57,3 +62,4 @@ class ConfigDTO:
         self.timeout = timeout
         self.should_verify_certificate = should_verify_certificate
         self.headless_mode = headless_mode
+        self.request_delay = request_delay
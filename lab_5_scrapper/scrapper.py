@@ -7,18 +7,30 @@ import json
 import pathlib
 import re
 import shutil
-from random import randrange
-from time import sleep
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from math import isfinite
+from threading import local, Lock
+from time import monotonic, sleep, time
 from typing import Pattern, Union
+from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from core_utils import constants
 from core_utils.article.article import Article
 from core_utils.article.io import to_meta, to_raw
 from core_utils.config_dto import ConfigDTO
 
+_SEED_URL_PATTERN = re.compile(r"https?://(www)?\.sbras\.info/news+")
+_HREF_XPATH = etree.XPath('//@href')
+_META_XPATH = etree.XPath('//*[@itemprop="headline" or @itemprop="datePublished"]')
+
 
 class IncorrectSeedURLError(Exception):
     """
@@ -62,6 +74,12 @@ class IncorrectVerifyError(Exception):
     """
 
 
+class IncorrectRequestDelayError(Exception):
+    """
+    The delay between requests is not a non-negative number.
+    """
+
+
 class Config:
     """
     Class for unpacking and validating configurations.
@@ -75,8 +93,8 @@ class Config:
             path_to_config (pathlib.Path): Path to configuration.
         """
         self.path_to_config = path_to_config
-        self._validate_config_content()
         self.config = self._extract_config_content()
+        self._validate_config_content()
 
         self._seed_urls = self.config.seed_urls
         self._num_articles = self.config.total_articles
@@ -85,6 +103,7 @@ class Config:
         self._timeout = self.config.timeout
         self._should_verify_certificate = self.config.should_verify_certificate
         self._headless_mode = self.config.headless_mode
+        self._request_delay = self.config.request_delay
 
     def _extract_config_content(self) -> ConfigDTO:
         """
@@ -101,12 +120,11 @@ class Config:
         """
         Ensure configuration parameters are not corrupt.
         """
-        config = self._extract_config_content()
+        config = self.config
 
         if not (isinstance(config.seed_urls, list)
-                and all(re.match(r"https?://(www)?\.sbras\.info/news+", seed_url)
-                        for seed_url in config.seed_urls
-                        )
+                and all(isinstance(seed_url, str) and _SEED_URL_PATTERN.match(seed_url)
+                        for seed_url in config.seed_urls)
                 ):
             raise IncorrectSeedURLError
 
@@ -129,6 +147,11 @@ class Config:
                 or config.timeout > 60 or config.timeout < 0:
             raise IncorrectTimeoutError
 
+        if isinstance(config.request_delay, bool) \
+                or not isinstance(config.request_delay, (int, float)) \
+                or config.request_delay < 0:
+            raise IncorrectRequestDelayError
+
     def get_seed_urls(self) -> list[str]:
         """
         Retrieve seed urls.
@@ -192,6 +215,124 @@ class Config:
         """
         return self._headless_mode
 
+    def get_request_delay(self) -> float:
+        """
+        Retrieve minimal number of seconds between requests to one host.
+
+        Returns:
+            float: Minimal number of seconds between requests to one host
+        """
+        return self._request_delay
+
+
+class RateLimiter:
+    """
+    Keep a minimal delay between requests to the same host.
+    """
+
+    #: Reset values above this are unix timestamps rather than numbers of seconds
+    _TIMESTAMP_THRESHOLD = 10 ** 9
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the RateLimiter class.
+        """
+        self._next_allowed: dict[str, float] = {}
+        self._lock = Lock()
+
+    def wait(self, url: str, min_delay: float) -> None:
+        """
+        Block until a request to the host of the url is allowed.
+
+        Args:
+            url (str): Url to request
+            min_delay (float): Minimal number of seconds between requests to one host
+        """
+        host = urlparse(url).netloc
+        with self._lock:
+            now = monotonic()
+            start = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = start + min_delay
+        sleep(start - now)
+
+    def update(self, url: str, response: requests.models.Response) -> None:
+        """
+        Postpone requests to the host if the response asks to slow down.
+
+        Args:
+            url (str): Requested url
+            response (requests.models.Response): A response from a request
+        """
+        pause = self._get_pause(response.headers)
+        if not pause:
+            return
+        host = urlparse(url).netloc
+        with self._lock:
+            self._next_allowed[host] = max(self._next_allowed.get(host, 0.0),
+                                           monotonic() + pause)
+
+    @staticmethod
+    def _get_pause(headers: requests.structures.CaseInsensitiveDict) -> float:
+        """
+        Retrieve number of seconds to wait from rate limiting headers.
+
+        Args:
+            headers (requests.structures.CaseInsensitiveDict): Response headers
+
+        Returns:
+            float: Number of seconds to wait
+        """
+        retry_after: str | None = headers.get('Retry-After')
+        if retry_after:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                try:
+                    pause = parsedate_to_datetime(retry_after).timestamp() - time()
+                except (TypeError, ValueError):
+                    pause = 0.0
+            return pause if isfinite(pause) and pause > 0 else 0.0
+
+        reset: str | None = headers.get('X-RateLimit-Reset')
+        if headers.get('X-RateLimit-Remaining') != '0' or not reset:
+            return 0.0
+        try:
+            pause = float(reset)
+        except ValueError:
+            return 0.0
+        # the reset is sent either as a unix timestamp or as a number of seconds
+        if pause > RateLimiter._TIMESTAMP_THRESHOLD:
+            pause -= time()
+        return pause if isfinite(pause) and pause > 0 else 0.0
+
+
+def _build_session() -> requests.Session:
+    """
+    Create a session reusing keep-alive connections between requests.
+
+    Returns:
+        requests.Session: Session with pooled connections and retries
+    """
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=1.5,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False)
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+_SESSION = _build_session()
+_MAX_WORKERS = 10
+_SEED_PREFETCH = 2
+_RATE_LIMITER = RateLimiter()
+_HTML_PARSERS = local()
+_CHECKPOINT_PATH = constants.PROJECT_ROOT / 'tmp' / 'crawled_urls' / 'crawler_state.json'
+
 
 def make_request(url: str, config: Config) -> requests.models.Response:
     """
@@ -204,14 +345,37 @@ def make_request(url: str, config: Config) -> requests.models.Response:
     Returns:
         requests.models.Response: A response from a request
     """
-    sleep(randrange(3))
+    _RATE_LIMITER.wait(url, config.get_request_delay())
 
-    return requests.get(
+    response = _SESSION.get(
         url=url,
         timeout=config.get_timeout(),
         headers=config.get_headers(),
         verify=config.get_verify_certificate()
     )
+    _RATE_LIMITER.update(url, response)
+    return response
+
+
+def _parse_html(response: requests.models.Response, config: Config) -> html.HtmlElement:
+    """
+    Parse raw response bytes reusing one lxml parser per thread and encoding.
+
+    Args:
+        response (requests.models.Response): A response from a request
+        config (Config): Configuration
+
+    Returns:
+        lxml.html.HtmlElement: Parsed HTML tree
+    """
+    if not hasattr(_HTML_PARSERS, 'by_encoding'):
+        _HTML_PARSERS.by_encoding = {}
+    encoding = config.get_encoding()
+    parser = _HTML_PARSERS.by_encoding.get(encoding)
+    if parser is None:
+        parser = html.HTMLParser(recover=True, encoding=encoding)
+        _HTML_PARSERS.by_encoding[encoding] = parser
+    return html.fromstring(response.content, parser=parser)
 
 
 class Crawler:
@@ -230,49 +394,68 @@ class Crawler:
         """
         self.config = config
         self.urls = []
+        self._seen: set[str] = set()
         self.base_url = "https://www.sbras.info/news"
 
-    def _extract_url(self, article_bs: BeautifulSoup) -> str:
+    def _extract_url(self, article_tree: html.HtmlElement, limit: int) -> list[str]:
         """
-        Find and retrieve url from HTML.
+        Find and retrieve new article urls from HTML in a single pass.
 
         Args:
-            article_bs (bs4.BeautifulSoup): BeautifulSoup instance
+            article_tree (lxml.html.HtmlElement): Parsed HTML tree
+            limit (int): Maximal number of urls to retrieve
 
         Returns:
-            str: Url from HTML
+            list[str]: Urls from HTML that are not collected yet
         """
-        links = article_bs.find_all('a', {'href': re.compile('/news/+')}, hreflang='ru')
-        for link in links:
-            url = str(self.base_url[:-len('/news'):] + link.get('href'))
-            if url not in self.urls:
+        urls = []
+        found = set()
+        for link in article_tree.iter('a'):
+            if len(urls) >= limit:
                 break
-        else:
-            url = ''  # for the last link if it didn't reach break
-        return url
+            href = link.get('href')
+            if not href or '/news/' not in href or link.get('hreflang') != 'ru':
+                continue
+            url = self.base_url[:-len('/news'):] + href
+            if url not in self._seen and url not in found:
+                urls.append(url)
+                found.add(url)
+        return urls
+
+    def _get_remaining_budget(self) -> int:
+        """
+        Get number of articles left to find.
+
+        Returns:
+            int: Number of articles left to find
+        """
+        return self.config.get_num_articles() - len(self.urls)
 
     def find_articles(self) -> None:
         """
         Find articles.
         """
-        seed_urls = self.get_search_urls()
-
-        for seed_url in seed_urls:
-            response = make_request(seed_url, self.config)
-            if not response.ok:
-                continue
-
-            article_bs = BeautifulSoup(response.text, "lxml")
-
-            extracted_url = self._extract_url(article_bs)
-            while extracted_url:
-                if len(self.urls) == self.config.get_num_articles():
+        seed_urls = iter(self.get_search_urls())
+
+        with ThreadPoolExecutor(max_workers=_SEED_PREFETCH) as executor:
+            # the first page may fill the budget alone, so prefetching starts after it
+            pending = deque(executor.submit(make_request, seed_url, self.config)
+                            for seed_url in islice(seed_urls, 1))
+            while pending:
+                response = pending.popleft().result()
+                if response.ok:
+                    article_tree = _parse_html(response, self.config)
+                    new_urls = self._extract_url(article_tree, self._get_remaining_budget())
+                    self.urls.extend(new_urls)
+                    self._seen.update(new_urls)
+
+                if self._get_remaining_budget() <= 0:
                     break
-                self.urls.append(extracted_url)
-                extracted_url = self._extract_url(article_bs)
+                pending.extend(executor.submit(make_request, seed_url, self.config)
+                               for seed_url in islice(seed_urls, _SEED_PREFETCH - len(pending)))
 
-            if len(self.urls) == self.config.get_num_articles():
-                break
+            for future in pending:
+                future.cancel()
 
     def get_search_urls(self) -> list:
         """
@@ -289,40 +472,62 @@ class Crawler:
 class CrawlerRecursive(Crawler):
     """
     Recursive Crawler is a child of Crawler class.
+
+    Crawling state is saved to a checkpoint, so an interrupted crawl resumes from it.
+    The checkpoint is ignored if seed urls have changed and is removed by clear_checkpoint.
     """
     def __init__(self, config: Config) -> None:
         super().__init__(config)
 
-        crawled_urls_path = pathlib.Path('tmp/crawled_urls/')
-        if crawled_urls_path.joinpath('all_urls.txt').exists():
-            with open(crawled_urls_path / 'all_urls.txt', 'r', encoding='utf-8') as f:
-                self.already_crawled = [line[:-1] for line in f.readlines()]
-            self.start_url = self.already_crawled[-1]
-        else:
-            self.already_crawled = []
-            self.start_url = self.base_url
+        self._checkpoint_path = _CHECKPOINT_PATH
+        self.already_crawled = []
+        state = {}
+        if self._checkpoint_path.exists():
+            with open(self._checkpoint_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        if state.get('seed_urls') == self.get_search_urls():
+            self.already_crawled = state['visited_seeds']
+            # the budget may have been lowered since the checkpoint was saved
+            self.urls = state['urls'][:self.config.get_num_articles()]
+        self._seen = set(self.urls)
+        self._crawled = set(self.already_crawled)
+        self.start_url = (self.urls or self.already_crawled or [self.base_url])[-1]
 
-        if crawled_urls_path.joinpath('all_urls.txt').exists():
-            with open(crawled_urls_path / 'article_urls.txt', 'r', encoding='utf-8') as f:
-                self.urls = [line[:-1] for line in f.readlines()]
-            self.start_url = self.urls[-1]
+    def _save_checkpoint(self) -> None:
+        """
+        Save visited pages and found article urls to resume crawling later.
+        """
+        self._checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._checkpoint_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'seed_urls': self.get_search_urls(),
+                       'visited_seeds': self.already_crawled,
+                       'urls': self.urls}, f)
+        tmp_path.replace(self._checkpoint_path)
+
+    def clear_checkpoint(self) -> None:
+        """
+        Remove saved crawling state so that the next crawl starts from scratch.
+        """
+        self._checkpoint_path.unlink(missing_ok=True)
 
     def find_articles(self) -> None:
-        if len(self.urls) == self.config.get_num_articles():
+        if self._get_remaining_budget() <= 0:
+            self._save_checkpoint()
             return
 
         response = make_request(self.start_url, self.config)
         if not response.ok:
             return
+        self._save_checkpoint()
 
-        article_bs = BeautifulSoup(response.text, "lxml")
+        article_tree = _parse_html(response, self.config)
 
-        all_urls = [self.base_url + link.get('href')
-                        for link in article_bs.find_all(href=True)
-                        if 'http' not in link.get('href')
-                        and '.ico' not in link.get('href')
-                        and 'css' not in link.get('href')]
-        all_urls = [url.replace('/news'*2, '/news') for url in all_urls]
+        all_urls = ((self.base_url + href).replace('/news'*2, '/news')
+                    for href in _HREF_XPATH(article_tree)
+                    if 'http' not in href
+                    and '.ico' not in href
+                    and 'css' not in href)
         # all urls to my site pages are put into the html code as
         # /something/..., but not the full link like
         # https://www.sbras.info/news/something/...,
@@ -332,35 +537,28 @@ class CrawlerRecursive(Crawler):
         # but refer to core components, like .ico/css files, so there's no need to have them
 
         for url in all_urls:
-            if url in self.already_crawled:
+            if url in self._crawled:
                 continue
             self.already_crawled.append(url)
-            with open('tmp/crawled_urls/all_urls.txt', 'a',
-                      encoding='utf-8', newline='\n') as f:
-                f.write(f"{url}\n")
+            self._crawled.add(url)
 
             self.start_url = url
 
-            extracted_url = self._extract_url(article_bs)
-            while extracted_url:
-                if extracted_url in self.urls:
-                    extracted_url = self._extract_url(article_bs)
+            for extracted_url in self._extract_url(article_tree, self._get_remaining_budget()):
+                if extracted_url in self._seen:
                     continue
 
                 self.urls.append(extracted_url)
-                with open('tmp/crawled_urls/article_urls.txt', 'a',
-                          encoding='utf-8', newline='\n') as f:
-                    f.write(f"{extracted_url}\n")
-
-                if len(self.urls) == self.config.get_num_articles():
-                    return
+                self._seen.add(extracted_url)
 
                 self.start_url = extracted_url
                 self.find_articles()
-
-                extracted_url = self._extract_url(article_bs)
+                if self._get_remaining_budget() <= 0:
+                    return
 
             self.find_articles()
+            if self._get_remaining_budget() <= 0:
+                return
 
         return
 
@@ -384,44 +582,61 @@ class HTMLParser:
         self.config = config
         self.article = Article(self.full_url, self.article_id)
 
-    def _fill_article_with_text(self, article_soup: BeautifulSoup) -> None:
+    @staticmethod
+    def _collect_nodes(article_tree: html.HtmlElement) -> dict[str, list[html.HtmlElement]]:
+        """
+        Collect nodes holding article information letting lxml filter tags.
+
+        Args:
+            article_tree (lxml.html.HtmlElement): Parsed HTML tree
+
+        Returns:
+            dict[str, list[html.HtmlElement]]: Headline, date, paragraph and topic nodes
+        """
+        nodes = {'headline': [], 'date': [], 'paragraphs': [], 'topics': []}
+        for element in article_tree.iter('p', 'a'):
+            if element.tag == 'p':
+                nodes['paragraphs'].append(element)
+            elif '/tags/' in element.get('href', ''):
+                nodes['topics'].append(element)
+
+        for element in _META_XPATH(article_tree):
+            if element.get('itemprop') == 'headline':
+                nodes['headline'].append(element)
+            else:
+                nodes['date'].append(element)
+        return nodes
+
+    def _fill_article_with_text(self, nodes: dict[str, list[html.HtmlElement]]) -> None:
         """
         Find text of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            nodes (dict[str, list[html.HtmlElement]]): Nodes collected from HTML tree
         """
-        text_blocks = article_soup.find_all('p')[:-3]  # exclude copyright info
-        raw_text = [text_block.text for text_block in text_blocks
-                    if text_block.text]
-        self.article.text = '\n'.join(raw_text)
+        text_blocks = nodes['paragraphs'][:-3]  # exclude copyright info
+        raw_text = (text_block.text_content() for text_block in text_blocks)
+        self.article.text = '\n'.join(text for text in raw_text if text)
 
-    def _fill_article_with_meta_information(self, article_soup: BeautifulSoup) -> None:
+    def _fill_article_with_meta_information(self,
+                                            nodes: dict[str, list[html.HtmlElement]]) -> None:
         """
         Find meta information of article.
 
         Args:
-            article_soup (bs4.BeautifulSoup): BeautifulSoup instance
+            nodes (dict[str, list[html.HtmlElement]]): Nodes collected from HTML tree
         """
-        self.article.title = str(article_soup.find(itemprop="headline").string)
+        self.article.title = nodes['headline'][0].text_content()
 
-        date = article_soup.find(itemprop="datePublished").attrs['datetime']
+        date = nodes['date'][0].get('datetime')
         if date:
             self.article.date = self.unify_date_format(date)
 
-        last_paragraph = article_soup.find_all('p')[-3]  # exclude copyright info
-        author = last_paragraph.find('strong')
-        if author:
-            author = author.text
-        else:
-            author = 'NOT FOUND'
-        self.article.author = [author]
+        last_paragraph = nodes['paragraphs'][-3]  # exclude copyright info
+        author = last_paragraph.find('.//strong')
+        self.article.author = [author.text_content() if author is not None else 'NOT FOUND']
 
-        topic_fields = article_soup.find_all('a', {'href': re.compile('/tags/+')})
-        if topic_fields:
-            self.article.topics = [topic.string for topic in topic_fields]
-        else:
-            self.article.topics = []
+        self.article.topics = [topic.text_content() for topic in nodes['topics']]
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
@@ -433,7 +648,7 @@ class HTMLParser:
         Returns:
             datetime.datetime: Datetime object
         """
-        return datetime.datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
+        return datetime.datetime.fromisoformat(date_str)
 
     def parse(self) -> Union[Article, bool, list]:
         """
@@ -444,9 +659,9 @@ class HTMLParser:
         """
         response = make_request(self.full_url, self.config)
         if response.ok:
-            article_bs = BeautifulSoup(response.text, 'lxml')
-            self._fill_article_with_text(article_bs)
-            self._fill_article_with_meta_information(article_bs)
+            nodes = self._collect_nodes(_parse_html(response, self.config))
+            self._fill_article_with_text(nodes)
+            self._fill_article_with_meta_information(nodes)
 
         return self.article
 
@@ -459,10 +674,27 @@ def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
         base_path (Union[pathlib.Path, str]): Path where articles stores
     """
     if base_path.exists():
-        shutil.rmtree(base_path.parent)
+        shutil.rmtree(base_path)
     base_path.mkdir(parents=True)
 
 
+def _collect_articles(urls: list[str], config: Config) -> None:
+    """
+    Parse articles concurrently and save them.
+
+    Args:
+        urls (list[str]): Urls of articles to parse
+        config (Config): Configuration
+    """
+    parsers = [HTMLParser(full_url=url, article_id=index + 1, config=config)
+               for index, url in enumerate(urls)]
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        for article in executor.map(HTMLParser.parse, parsers):
+            if isinstance(article, Article):
+                to_raw(article)
+                to_meta(article)
+
+
 def main() -> None:
     """
     Entrypoint for scrapper module.
@@ -473,12 +705,7 @@ def main() -> None:
     crawler = Crawler(config=configuration)
     crawler.find_articles()
 
-    for index, url in enumerate(crawler.urls):
-        parser = HTMLParser(full_url=url, article_id=index + 1, config=configuration)
-        article = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
+    _collect_articles(crawler.urls, configuration)
 
 
 def main_recursive() -> None:
@@ -486,19 +713,15 @@ def main_recursive() -> None:
     Entrypoint for recursive scrapper module.
     """
     prepare_environment(constants.ASSETS_PATH)
-    prepare_environment(pathlib.Path('tmp/crawled_urls/'))
+    _CHECKPOINT_PATH.parent.mkdir(parents=True, exist_ok=True)
 
     configuration = Config(path_to_config=constants.CRAWLER_CONFIG_PATH)
     crawler = CrawlerRecursive(config=configuration)
     crawler.find_articles()
 
     if len(crawler.urls) == configuration.get_num_articles():
-        for index, url in enumerate(crawler.urls):
-            parser = HTMLParser(full_url=url, article_id=index + 1, config=configuration)
-            article = parser.parse()
-            if isinstance(article, Article):
-                to_raw(article)
-                to_meta(article)
+        _collect_articles(crawler.urls, configuration)
+        crawler.clear_checkpoint()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Generate config with flexible params for testing purposes.
 import json
 import shutil
 from pathlib import Path
+from typing import Any
 
 from admin_utils.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
 
@@ -16,7 +17,8 @@ def generate_config(seed_urls: list,
                     timeout: int,
                     should_verify_certificate: bool,
                     headless_mode: bool,
-                    path: Path = TEST_CRAWLER_CONFIG_PATH) -> None:
+                    path: Path = TEST_CRAWLER_CONFIG_PATH,
+                    request_delay: Any = None) -> None:
     """
     Generate scrapper_config.py for testing.
 
@@ -29,6 +31,7 @@ def generate_config(seed_urls: list,
         should_verify_certificate (bool): Should verify certificate or not
         headless_mode (bool): Require headless mode or not
         path (Path): Path to test crawler configuration
+        request_delay (Any): Minimal number of seconds between requests, omitted if None
     """
     config = {'seed_urls': seed_urls,
               'total_articles_to_find_and_parse': num_articles,
@@ -37,6 +40,8 @@ def generate_config(seed_urls: list,
               'timeout': timeout,
               'should_verify_certificate': should_verify_certificate,
               'headless_mode': headless_mode}
+    if request_delay is not None:
+        config['request_delay'] = request_delay
 
     if path.exists():
         shutil.rmtree(TEST_PATH)
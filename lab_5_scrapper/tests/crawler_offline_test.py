@@ -0,0 +1,292 @@
+"""
+Crawler checks on generated pages without network access.
+"""
+import json
+import shutil
+import unittest
+from threading import Lock
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from admin_utils.test_params import TEST_PATH
+
+from core_utils.constants import CRAWLER_CONFIG_PATH
+from lab_5_scrapper.scrapper import Config, Crawler, CrawlerRecursive
+
+LINKS_PER_PAGE = 20
+
+
+def generate_page(page: int) -> bytes:
+    """
+    Generate seed page with links to articles.
+
+    Args:
+        page (int): Number of seed page
+
+    Returns:
+        bytes: HTML code of the page
+    """
+    links = ''.join(f'<a href="/news/page{page}-{number}" hreflang="ru">{number}</a>'
+                    for number in range(LINKS_PER_PAGE))
+    return f'<html><body>{links}</body></html>'.encode('utf-8')
+
+
+class FakeSite:
+    """
+    Respond with generated pages and remember requested urls.
+    """
+
+    def __init__(self, broken_pages: tuple[int, ...] = ()) -> None:
+        """
+        Initialize an instance of the FakeSite class.
+
+        Args:
+            broken_pages (tuple[int, ...]): Numbers of pages responding with an error
+        """
+        self.requested = []
+        self._broken_pages = broken_pages
+        self._lock = Lock()
+
+    def make_request(self, url: str, config: Config) -> SimpleNamespace:
+        """
+        Respond with the generated page for a seed url, the first page for other urls.
+
+        Args:
+            url (str): Site url
+            config (Config): Configuration
+
+        Returns:
+            SimpleNamespace: Response alike object
+        """
+        with self._lock:
+            self.requested.append(url)
+        page = int(url.rsplit('=', maxsplit=1)[-1]) if '=' in url else 0
+        return SimpleNamespace(ok=page not in self._broken_pages, content=generate_page(page))
+
+
+class CrawlerPrefetchTest(unittest.TestCase):
+    """
+    Tests for fetching seed pages ahead of extraction.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlerPrefetchTest class.
+        """
+        self.config = Config(CRAWLER_CONFIG_PATH)
+
+    def crawl(self, num_articles: int, site: FakeSite) -> Crawler:
+        """
+        Find articles on the fake site.
+
+        Args:
+            num_articles (int): Number of articles to find
+            site (FakeSite): Fake site to request
+
+        Returns:
+            Crawler: Crawler after finding articles
+        """
+        self.config._num_articles = num_articles  # pylint: disable=protected-access
+        crawler = Crawler(self.config)
+        with mock.patch('lab_5_scrapper.scrapper.make_request', side_effect=site.make_request):
+            crawler.find_articles()
+        return crawler
+
+    @staticmethod
+    def expected_urls(num_articles: int, pages: tuple[int, ...]) -> list[str]:
+        """
+        Get urls the crawler should find on the fake site.
+
+        Args:
+            num_articles (int): Number of articles to find
+            pages (tuple[int, ...]): Numbers of pages to take urls from
+
+        Returns:
+            list[str]: Expected urls
+        """
+        return [f'https://www.sbras.info/news/page{page}-{number}'
+                for page in pages for number in range(LINKS_PER_PAGE)][:num_articles]
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_budget_met_by_first_page(self) -> None:
+        """
+        Ensure no other seed page is requested when the first one fills the budget.
+        """
+        site = FakeSite()
+        crawler = self.crawl(5, site)
+        self.assertEqual(self.expected_urls(5, (0,)), crawler.urls)
+        self.assertEqual([self.config.get_seed_urls()[0]], site.requested)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_urls_keep_seed_order(self) -> None:
+        """
+        Ensure urls of several pages are collected in order of seed urls.
+        """
+        site = FakeSite()
+        crawler = self.crawl(45, site)
+        self.assertEqual(self.expected_urls(45, (0, 1, 2)), crawler.urls)
+        self.assertLessEqual(len(site.requested), 4)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_broken_pages_are_skipped(self) -> None:
+        """
+        Ensure pages responding with an error do not stop crawling.
+        """
+        site = FakeSite(broken_pages=(0, 2))
+        crawler = self.crawl(30, site)
+        self.assertEqual(self.expected_urls(30, (1, 3)), crawler.urls)
+
+
+class CrawlerRecursiveCheckpointTest(unittest.TestCase):
+    """
+    Tests for saving and restoring CrawlerRecursive state.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CrawlerRecursiveCheckpointTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_path = TEST_PATH / 'crawler_state.json'
+        patcher = mock.patch('lab_5_scrapper.scrapper._CHECKPOINT_PATH', self.checkpoint_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.config = Config(CRAWLER_CONFIG_PATH)
+        self.urls = [f'https://www.sbras.info/news/page0-{number}' for number in range(5)]
+
+    def save_state(self, urls: list[str], seed_urls: list[str] | None = None) -> None:
+        """
+        Write a checkpoint as if left by a previous crawl.
+
+        Args:
+            urls (list[str]): Found article urls
+            seed_urls (list[str] | None): Seed urls of the previous crawl
+        """
+        state = {'seed_urls': seed_urls or self.config.get_seed_urls(),
+                 'visited_seeds': urls[:1],
+                 'urls': urls}
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as file:
+            json.dump(state, file)
+
+    def crawl(self, num_articles: int, site: FakeSite) -> CrawlerRecursive:
+        """
+        Find articles on the fake site recursively.
+
+        Args:
+            num_articles (int): Number of articles to find
+            site (FakeSite): Fake site to request
+
+        Returns:
+            CrawlerRecursive: Crawler after finding articles
+        """
+        self.config._num_articles = num_articles  # pylint: disable=protected-access
+        crawler = CrawlerRecursive(self.config)
+        with mock.patch('lab_5_scrapper.scrapper.make_request', side_effect=site.make_request):
+            crawler.find_articles()
+        return crawler
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_is_loaded(self) -> None:
+        """
+        Ensure found urls are loaded and crawling continues from the last one.
+        """
+        self.save_state(self.urls[:2])
+        crawler = CrawlerRecursive(self.config)
+        self.assertEqual(self.urls[:2], crawler.urls)
+        self.assertEqual(self.urls[1], crawler.start_url)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_is_trimmed_to_budget(self) -> None:
+        """
+        Ensure a checkpoint with more urls than needed is cut to the budget without requests.
+        """
+        self.save_state(self.urls)
+        site = FakeSite()
+        crawler = self.crawl(3, site)
+        self.assertEqual(self.urls[:3], crawler.urls)
+        self.assertEqual([], site.requested)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_for_other_seed_urls_is_skipped(self) -> None:
+        """
+        Ensure a checkpoint left by a crawl with other seed urls is ignored.
+        """
+        self.save_state(self.urls, seed_urls=['https://www.sbras.info/news?page=100'])
+        crawler = CrawlerRecursive(self.config)
+        self.assertEqual([], crawler.urls)
+        self.assertEqual(crawler.base_url, crawler.start_url)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_crawl_resumes_from_checkpoint(self) -> None:
+        """
+        Ensure a resumed crawl keeps found urls and requests only its start page again.
+        """
+        first = self.crawl(2, FakeSite())
+        with open(self.checkpoint_path, 'r', encoding='utf-8') as file:
+            self.assertEqual(first.urls, json.load(file)['urls'])
+
+        site = FakeSite()
+        second = self.crawl(4, site)
+        self.assertEqual(first.urls, second.urls[:2])
+        self.assertEqual(4, len(set(second.urls)))
+        self.assertLessEqual(set(site.requested) & set(first.already_crawled), {first.urls[-1]})
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_is_replaced_atomically(self) -> None:
+        """
+        Ensure a failed save keeps the previous checkpoint intact.
+        """
+        self.save_state(self.urls[:2])
+        crawler = CrawlerRecursive(self.config)
+        crawler.urls.append(self.urls[2])
+        with mock.patch('lab_5_scrapper.scrapper.json.dump', side_effect=OSError):
+            with self.assertRaises(OSError):
+                crawler._save_checkpoint()  # pylint: disable=protected-access
+
+        self.assertEqual(self.urls[:2], CrawlerRecursive(self.config).urls)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_checkpoint_is_cleared(self) -> None:
+        """
+        Ensure a cleared checkpoint makes the next crawl start from scratch.
+        """
+        self.save_state(self.urls)
+        CrawlerRecursive(self.config).clear_checkpoint()
+        self.assertFalse(self.checkpoint_path.exists())
+        self.assertEqual([], CrawlerRecursive(self.config).urls)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CrawlerRecursiveCheckpointTest class.
+        """
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)
@@ -0,0 +1,203 @@
+"""
+Rate limiter checks.
+"""
+import unittest
+from email.utils import formatdate
+from unittest import mock
+
+import pytest
+from requests.structures import CaseInsensitiveDict
+
+from lab_5_scrapper.scrapper import RateLimiter
+
+NOW = 1712612311.0
+
+
+class RateLimiterPauseTest(unittest.TestCase):
+    """
+    Tests for parsing rate limiting headers.
+    """
+
+    def get_pause(self, headers: dict[str, str]) -> float:
+        """
+        Retrieve pause for headers at a fixed moment of time.
+
+        Args:
+            headers (dict[str, str]): Response headers
+
+        Returns:
+            float: Number of seconds to wait
+        """
+        with mock.patch('lab_5_scrapper.scrapper.time', return_value=NOW):
+            # pylint: disable=protected-access
+            return RateLimiter._get_pause(CaseInsensitiveDict(headers))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_no_rate_limiting_headers(self) -> None:
+        """
+        Ensure no pause is requested without rate limiting headers.
+        """
+        self.assertEqual(0.0, self.get_pause({}))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_seconds(self) -> None:
+        """
+        Ensure Retry-After in seconds is parsed, including fractional values.
+        """
+        self.assertEqual(120.0, self.get_pause({'Retry-After': '120'}))
+        self.assertEqual(1.5, self.get_pause({'retry-after': '1.5'}))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_http_date(self) -> None:
+        """
+        Ensure Retry-After as an HTTP date is converted to seconds left.
+        """
+        headers = {'Retry-After': formatdate(NOW + 30, usegmt=True)}
+        self.assertAlmostEqual(30.0, self.get_pause(headers))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_retry_after_invalid_values(self) -> None:
+        """
+        Ensure invalid, past and non-finite Retry-After values are ignored.
+        """
+        for value in ('soon', '-5', 'inf', 'nan', formatdate(NOW - 30, usegmt=True)):
+            self.assertEqual(0.0, self.get_pause({'Retry-After': value}), value)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_rate_limit_reset_seconds(self) -> None:
+        """
+        Ensure X-RateLimit-Reset as a number of seconds is used as is.
+        """
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '30'}
+        self.assertEqual(30.0, self.get_pause(headers))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_rate_limit_reset_timestamp(self) -> None:
+        """
+        Ensure X-RateLimit-Reset as a unix timestamp is converted to seconds left.
+        """
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(int(NOW) + 30)}
+        self.assertAlmostEqual(30.0, self.get_pause(headers))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_rate_limit_not_exhausted(self) -> None:
+        """
+        Ensure X-RateLimit-Reset is ignored while requests remain.
+        """
+        headers = {'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': '30'}
+        self.assertEqual(0.0, self.get_pause(headers))
+        headers = {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': 'later'}
+        self.assertEqual(0.0, self.get_pause(headers))
+
+
+class RateLimiterWaitTest(unittest.TestCase):
+    """
+    Tests for spacing requests to one host.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for RateLimiterWaitTest class.
+        """
+        self.limiter = RateLimiter()
+        self.clock = 100.0
+        self.pauses = []
+        patchers = (mock.patch('lab_5_scrapper.scrapper.monotonic', side_effect=lambda: self.clock),
+                    mock.patch('lab_5_scrapper.scrapper.sleep', side_effect=self.pauses.append))
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_wait_spaces_requests_to_one_host(self) -> None:
+        """
+        Ensure consecutive requests to one host are delayed by the minimal delay.
+        """
+        for _ in range(3):
+            self.limiter.wait('https://www.sbras.info/news?page=0', 0.5)
+        self.assertEqual([0.0, 0.5, 1.0], self.pauses)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_wait_does_not_delay_other_hosts(self) -> None:
+        """
+        Ensure requests to different hosts do not wait for each other.
+        """
+        self.limiter.wait('https://www.sbras.info/news', 0.5)
+        self.limiter.wait('https://example.com/', 0.5)
+        self.assertEqual([0.0, 0.0], self.pauses)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_wait_after_delay_passed(self) -> None:
+        """
+        Ensure no pause is made once the minimal delay has passed.
+        """
+        self.limiter.wait('https://www.sbras.info/news', 0.5)
+        self.clock += 2
+        self.limiter.wait('https://www.sbras.info/news', 0.5)
+        self.assertEqual([0.0, 0.0], self.pauses)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scrapper
+    def test_update_postpones_host(self) -> None:
+        """
+        Ensure a Retry-After response postpones the next request to the host.
+        """
+        response = mock.Mock(headers=CaseInsensitiveDict({'Retry-After': '3'}))
+        self.limiter.wait('https://www.sbras.info/news', 0.5)
+        self.limiter.update('https://www.sbras.info/news', response)
+        self.limiter.wait('https://www.sbras.info/news', 0.5)
+        self.assertEqual([0.0, 3.0], self.pauses)
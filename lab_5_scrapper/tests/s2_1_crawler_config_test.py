@@ -14,9 +14,9 @@ from admin_utils.test_params import TEST_CRAWLER_CONFIG_PATH, TEST_PATH
 from core_utils.constants import CRAWLER_CONFIG_PATH, TIMEOUT_LOWER_LIMIT, TIMEOUT_UPPER_LIMIT
 from lab_5_scrapper import scrapper
 from lab_5_scrapper.scrapper import (IncorrectEncodingError, IncorrectHeadersError,
-                                     IncorrectNumberOfArticlesError, IncorrectSeedURLError,
-                                     IncorrectTimeoutError, IncorrectVerifyError,
-                                     NumberOfArticlesOutOfRangeError)
+                                     IncorrectNumberOfArticlesError, IncorrectRequestDelayError,
+                                     IncorrectSeedURLError, IncorrectTimeoutError,
+                                     IncorrectVerifyError, NumberOfArticlesOutOfRangeError)
 from lab_5_scrapper.tests.config_generator import generate_config
 
 print("Stage 1A: Validating Crawler Config")
@@ -90,6 +90,7 @@ class CrawlerConfigCheck(ExtendedTestCase):
         self.encoding_incorrect = [5, False, [1, 2, 3]]
         self.verify_incorrect = ['verify', {1: 2}, (1, 2)]
         self.headless_incorrect = ['false', {1: 4}, (1, 2, 3)]
+        self.request_delay_incorrect = [-1, -0.5, True, 'one second']
 
     @pytest.mark.mark4
     @pytest.mark.mark6
@@ -298,6 +299,55 @@ Headers must be a dictionary with string keys and string values"""
                                      scrapper.Config,
                                      TEST_CRAWLER_CONFIG_PATH)
 
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_1_crawler_config_check
+    @pytest.mark.lab_5_scrapper
+    def test_incorrect_request_delay_config_param(self) -> None:
+        """
+        Config class returns error message and exit code 1 with incorrect config params.
+        """
+        for incorrect_request_delay in self.request_delay_incorrect:
+            generate_config(seed_urls=self.seed_urls_correct,
+                            num_articles=self.num_articles_correct,
+                            timeout=self.timeout_correct,
+                            headers=self.headers_correct,
+                            encoding=self.encoding_correct,
+                            should_verify_certificate=self.should_verify_certificate,
+                            headless_mode=self.headless_mode,
+                            request_delay=incorrect_request_delay)
+
+            error_message = """Checking that scrapper can handle incorrect request delay inputs.
+    Request delay must be a non-negative number"""
+            self.assertRaisesWithMessage(error_message,
+                                         IncorrectRequestDelayError,
+                                         scrapper.Config,
+                                         TEST_CRAWLER_CONFIG_PATH)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_1_crawler_config_check
+    @pytest.mark.lab_5_scrapper
+    def test_request_delay_config_param(self) -> None:
+        """
+        Config class reads request delay and falls back to default one when it is omitted.
+        """
+        for request_delay, expected in ((None, 1.0), (0, 0), (0.25, 0.25)):
+            generate_config(seed_urls=self.seed_urls_correct,
+                            num_articles=self.num_articles_correct,
+                            timeout=self.timeout_correct,
+                            headers=self.headers_correct,
+                            encoding=self.encoding_correct,
+                            should_verify_certificate=self.should_verify_certificate,
+                            headless_mode=self.headless_mode,
+                            request_delay=request_delay)
+            config = scrapper.Config(TEST_CRAWLER_CONFIG_PATH)
+            self.assertEqual(expected, config.get_request_delay())
+
     @pytest.mark.mark4
     @pytest.mark.mark6
     @pytest.mark.mark8
@@ -2,14 +2,21 @@
 Pipeline for CONLL-U formatting.
 """
 # pylint: disable=too-few-public-methods, unused-import, undefined-variable, too-many-nested-blocks
+import os
 import pathlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict
+from functools import partial
+from itertools import chain
+from typing import Callable, cast, Iterator
 
 import spacy_udpipe
 import stanza
 from networkx import to_dict_of_lists
 from networkx.algorithms.isomorphism.vf2userfunc import GraphMatcher
 from networkx.classes.digraph import DiGraph
+from spacy.language import Language
 from stanza.models.common.doc import Document
 from stanza.pipeline.core import Pipeline
 from stanza.utils.conll import CoNLL
@@ -68,36 +75,32 @@ class CorpusManager:
         if not self.path_to_raw_txt_data.is_dir():
             raise NotADirectoryError  # built-in
 
-        if not any(self.path_to_raw_txt_data.iterdir()):
+        is_empty = True
+        sizes: dict[int, list[int | None]] = {}
+        with os.scandir(self.path_to_raw_txt_data) as entries:
+            for entry in entries:
+                is_empty = False
+                if entry.name.endswith('_meta.json'):
+                    slot = 0
+                elif entry.name.endswith('_raw.txt'):
+                    slot = 1
+                else:
+                    continue
+                article_id = get_article_id_from_filepath(pathlib.Path(entry.name))
+                sizes.setdefault(article_id, [None, None])[slot] = entry.stat().st_size
+        if is_empty:
             raise EmptyDirectoryError
 
-        metas = list(self.path_to_raw_txt_data.glob('*_meta.json'))
-        raws = list(self.path_to_raw_txt_data.glob('*_raw.txt'))
-        if len(metas) != len(raws):
+        if sizes.keys() != set(range(1, len(sizes) + 1)) \
+                or not all(meta_size and raw_size for meta_size, raw_size in sizes.values()):
             raise InconsistentDatasetError
 
-        metas.sort(key=lambda x: int(get_article_id_from_filepath(x)))
-        raws.sort(key=lambda x: int(get_article_id_from_filepath(x)))
-
-        for index, (meta, raw) in enumerate(zip(metas, raws)):
-            if index + 1 != get_article_id_from_filepath(meta) \
-                    or index + 1 != get_article_id_from_filepath(raw)\
-                    or meta.stat().st_size == 0 or raw.stat().st_size == 0:
-                raise InconsistentDatasetError
-
     def _scan_dataset(self) -> None:
         """
         Register each dataset entry.
         """
-        self._storage = {
-            get_article_id_from_filepath(file):
-            from_raw(
-                path=file,
-                article=Article(url=None,
-                                article_id=get_article_id_from_filepath(file))
-            )
-            for file in self.path_to_raw_txt_data.glob('*_raw.txt')
-        }
+        articles = (from_raw(path) for path in self.path_to_raw_txt_data.glob('*_raw.txt'))
+        self._storage = {article.article_id: article for article in articles}
 
     def get_articles(self) -> dict:
         """
@@ -109,13 +112,45 @@ class CorpusManager:
         return self._storage
 
 
+_BATCH_SIZE = 64
+_MIN_TEXTS_PER_WORKER = 50
+_WORKER_ANALYZER: LibraryWrapper | None = None
+
+
+def _init_worker(analyzer_factory: Callable[[], LibraryWrapper]) -> None:
+    """
+    Load an analyzer once per worker process.
+
+    Args:
+        analyzer_factory (Callable[[], LibraryWrapper]): Picklable callable creating the analyzer
+    """
+    global _WORKER_ANALYZER  # pylint: disable=global-statement
+    _WORKER_ANALYZER = analyzer_factory()
+
+
+def _analyze_in_worker(texts: list[str]) -> list[StanzaDocument | str]:
+    """
+    Process texts with the analyzer loaded in the worker process.
+
+    Args:
+        texts (list[str]): Collection of texts
+
+    Returns:
+        list[StanzaDocument | str]: List of documents
+    """
+    return _WORKER_ANALYZER.analyze(texts)
+
+
 class TextProcessingPipeline(PipelineProtocol):
     """
     Preprocess and morphologically annotate sentences into the CONLL-U format.
     """
 
     def __init__(
-        self, corpus_manager: CorpusManager, analyzer: LibraryWrapper | None = None
+        self,
+        corpus_manager: CorpusManager,
+        analyzer: LibraryWrapper | None = None,
+        analyzer_factory: Callable[[], LibraryWrapper] | None = None,
     ) -> None:
         """
         Initialize an instance of the TextProcessingPipeline class.
@@ -123,24 +158,71 @@ class TextProcessingPipeline(PipelineProtocol):
         Args:
             corpus_manager (CorpusManager): CorpusManager instance
             analyzer (LibraryWrapper | None): Analyzer instance
+            analyzer_factory (Callable[[], LibraryWrapper] | None): Picklable callable
+                creating the analyzer in worker processes, enables parallel analysis
+                of large corpora
         """
         self._corpus = corpus_manager
         self.analyzer = analyzer
+        self._analyzer_factory = analyzer_factory
 
     def run(self) -> None:
         """
         Perform basic preprocessing and write processed text to files.
         """
-        documents = []
-        if self.analyzer:
-            documents = self.analyzer.analyze([article.text for article
-                                               in self._corpus.get_articles().values()])
-
-        for num, article in enumerate(self._corpus.get_articles().values()):
+        articles = list(self._corpus.get_articles().values())
+        for article in articles:
             to_cleaned(article)
-            if self.analyzer and documents:
-                article.set_conllu_info(documents[num])
-                self.analyzer.to_conllu(article)
+        if not self.analyzer:
+            return
+
+        documents = self._analyze([article.text for article in articles])
+        first_document = next(documents, None)
+        if first_document is None:
+            # the analyzer does not produce any documents
+            return
+
+        for article, document in zip(articles, chain([first_document], documents), strict=True):
+            article.set_conllu_info(document)
+            self.analyzer.to_conllu(article)
+
+    def _analyze(self, texts: list[str]) -> Iterator[StanzaDocument | str]:
+        """
+        Process texts batch by batch, in worker processes for large corpora.
+
+        Worker processes are used only with an analyzer factory and when each worker gets
+        at least _MIN_TEXTS_PER_WORKER texts, as every worker has to load its own model.
+
+        Args:
+            texts (list[str]): Collection of texts
+
+        Returns:
+            Iterator[StanzaDocument | str]: Documents in the order of texts
+        """
+        workers = max(1, min(os.cpu_count() or 1, len(texts) // _MIN_TEXTS_PER_WORKER)) \
+            if self._analyzer_factory else 1
+        batch_size = min(_BATCH_SIZE, -(-len(texts) // workers)) if texts else _BATCH_SIZE
+        batches = [texts[start:start + batch_size]
+                   for start in range(0, len(texts), batch_size)]
+
+        if workers <= 1:
+            for batch in batches:
+                batch_documents = self.analyzer.analyze(batch)
+                if batch_documents:
+                    yield from batch_documents
+            return
+
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=partial(_init_worker,
+                                                     self._analyzer_factory)) as executor:
+            # keep at most two batches per worker in flight to bound memory
+            pending: deque[Future[list[StanzaDocument | str]]] = deque()
+            for batch in batches:
+                pending.append(executor.submit(_analyze_in_worker, batch))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result() or []
+            while pending:
+                yield from pending.popleft().result() or []
 
 
 class UDPipeAnalyzer(LibraryWrapper):
@@ -167,7 +249,11 @@ class UDPipeAnalyzer(LibraryWrapper):
         model.add_pipe(
             "conll_formatter",
             last=True,
-            config={"conversion_maps": {"XPOS": {"": "_"}}, "include_headers": True}
+            config={
+                "conversion_maps": {"XPOS": {"": "_"}},
+                "include_headers": True,
+                "disable_pandas": True
+            }
         )
         return model
 
@@ -181,7 +267,8 @@ class UDPipeAnalyzer(LibraryWrapper):
         Returns:
             list[StanzaDocument | str]: List of documents
         """
-        return [f"{self._analyzer(text)._.conll_str}\n" for text in texts]
+        model = cast(Language, self._analyzer)
+        return [f"{doc._.conll_str}\n" for doc in model.pipe(texts, batch_size=64)]
 
     def to_conllu(self, article: Article) -> None:
         """
@@ -455,7 +542,8 @@ def main() -> None:
     """
     corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH)
 
-    pipeline = TextProcessingPipeline(corpus_manager, UDPipeAnalyzer())
+    pipeline = TextProcessingPipeline(corpus_manager, UDPipeAnalyzer(),
+                                      analyzer_factory=UDPipeAnalyzer)
     pipeline.run()
 
     stanza_analyzer = StanzaAnalyzer()
@@ -3,13 +3,55 @@ Tests for processing text.
 """
 import shutil
 import unittest
+from unittest import mock
 
 import pytest
 from admin_utils.test_params import PIPE_TEST_FILES_FOLDER, TEST_PATH
 
 from core_utils.article import article
+from core_utils.article.article import ArtifactType
+from lab_6_pipeline import pipeline
 from lab_6_pipeline.pipeline import CorpusManager, TextProcessingPipeline, UDPipeAnalyzer
-from lab_6_pipeline.tests.utils import pipeline_test_files_setup
+from lab_6_pipeline.tests.utils import AnalyzerMock, pipeline_test_files_setup
+
+
+class BatchAnalyzerMock(AnalyzerMock):
+    """
+    Mock for analyzer recording batches and returning texts as documents.
+    """
+
+    def __init__(self, lost_documents: int = 0) -> None:
+        """
+        Initialize an instance of the BatchAnalyzerMock class.
+
+        Args:
+            lost_documents (int): Number of documents to drop from each batch
+        """
+        self.batch_sizes = []
+        self.conllu = {}
+        self._lost_documents = lost_documents
+
+    def analyze(self, texts: list[str]) -> list[str]:
+        """
+        Return texts as documents.
+
+        Args:
+            texts (list[str]): Collection of texts
+
+        Returns:
+            list[str]: List of documents
+        """
+        self.batch_sizes.append(len(texts))
+        return texts[:len(texts) - self._lost_documents]
+
+    def to_conllu(self, article: article.Article) -> None:
+        """
+        Remember content that would be saved to ConLLU format.
+
+        Args:
+            article (article.Article): Article containing information to save
+        """
+        self.conllu[article.article_id] = article.get_conllu_info()
 
 
 class TextProcessingPipelineScoreSixReferenceProcess(unittest.TestCase):
@@ -103,3 +145,113 @@ class TextProcessingPipelineScoreSixReferenceProcess(unittest.TestCase):
         Define final instructions for TextProcessingPipelineScoreSixReferenceProcess class.
         """
         shutil.rmtree(TEST_PATH)
+
+
+class TextProcessingPipelineScoreSixWorkerProcesses(unittest.TestCase):
+    """
+    Tests for analysis of texts in worker processes.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for TextProcessingPipelineScoreSixWorkerProcesses class.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+        for article_id in range(1, 4):
+            shutil.copyfile(PIPE_TEST_FILES_FOLDER / "1_raw.txt",
+                            TEST_PATH / f"{article_id}_raw.txt")
+            shutil.copyfile(PIPE_TEST_FILES_FOLDER / "1_meta.json",
+                            TEST_PATH / f"{article_id}_meta.json")
+        article.ASSETS_PATH = TEST_PATH
+        self.corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+        self.analyzer = UDPipeAnalyzer()
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_admin_data_processing
+    @pytest.mark.lab_6_pipeline
+    def test_worker_processes_match_in_process_analysis(self) -> None:
+        """
+        Ensure analysis in two worker processes equals analysis in the main process.
+        """
+        articles = self.corpus_manager.get_articles()
+        reference = self.analyzer.analyze([text.text for text in articles.values()])
+
+        pipe = TextProcessingPipeline(self.corpus_manager, self.analyzer,
+                                      analyzer_factory=UDPipeAnalyzer)
+        with mock.patch("lab_6_pipeline.pipeline.os.cpu_count", return_value=2), \
+                mock.patch("lab_6_pipeline.pipeline._MIN_TEXTS_PER_WORKER", 1), \
+                mock.patch("lab_6_pipeline.pipeline.ProcessPoolExecutor",
+                           wraps=pipeline.ProcessPoolExecutor) as executor:
+            pipe.run()
+        self.assertEqual(2, executor.call_args.kwargs["max_workers"])
+
+        for document, processed in zip(reference, articles.values(), strict=True):
+            path = processed.get_file_path(kind=ArtifactType.UDPIPE_CONLLU)
+            with open(path, "r", encoding="utf-8") as file:
+                self.assertEqual(document, file.read())
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for TextProcessingPipelineScoreSixWorkerProcesses class.
+        """
+        shutil.rmtree(TEST_PATH)
+
+
+class TextProcessingPipelineScoreSixBatchAnalysis(unittest.TestCase):
+    """
+    Tests for analysis of texts batch by batch.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for TextProcessingPipelineScoreSixBatchAnalysis class.
+        """
+        # pylint: disable=protected-access
+        self.articles_number = pipeline._BATCH_SIZE + 6
+        TEST_PATH.mkdir(exist_ok=True)
+        for article_id in range(1, self.articles_number + 1):
+            with open(TEST_PATH / f"{article_id}_raw.txt", "w", encoding="utf-8") as file:
+                file.write(f"Статья номер {article_id}.")
+            shutil.copyfile(PIPE_TEST_FILES_FOLDER / "1_meta.json",
+                            TEST_PATH / f"{article_id}_meta.json")
+        article.ASSETS_PATH = TEST_PATH
+        self.corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_admin_data_processing
+    @pytest.mark.lab_6_pipeline
+    def test_documents_are_matched_to_articles(self) -> None:
+        """
+        Ensure every article gets its own document when texts do not fit in one batch.
+        """
+        analyzer = BatchAnalyzerMock()
+        TextProcessingPipeline(self.corpus_manager, analyzer).run()
+
+        # pylint: disable=protected-access
+        self.assertGreater(len(analyzer.batch_sizes), 1)
+        self.assertLessEqual(max(analyzer.batch_sizes), pipeline._BATCH_SIZE)
+        self.assertEqual(self.articles_number, sum(analyzer.batch_sizes))
+        for article_id, processed in self.corpus_manager.get_articles().items():
+            self.assertEqual(processed.text, analyzer.conllu[article_id])
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_admin_data_processing
+    @pytest.mark.lab_6_pipeline
+    def test_missing_documents_raise_error(self) -> None:
+        """
+        Ensure pipeline fails when analyzer returns fewer documents than articles.
+        """
+        pipe = TextProcessingPipeline(self.corpus_manager, BatchAnalyzerMock(lost_documents=1))
+        self.assertRaises(ValueError, pipe.run)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for TextProcessingPipelineScoreSixBatchAnalysis class.
+        """
+        shutil.rmtree(TEST_PATH)